@@ -429,10 +429,12 @@ def generate() -> None:
     """Generate an MCP server from API documentation."""
     from apitomcp.config import load_config
     from apitomcp.ui import (
+        buffered_output,
         console,
         print_error,
         print_header,
         print_info,
+        print_muted_lines,
         print_success,
         print_warning,
         prompt_confirm,
@@ -486,7 +488,9 @@ def generate() -> None:
                     f"Scraping {progress.pages_scraped} pages | {short_url}"
                 )
 
-            scrape_result = scrape_documentation(url, on_progress=on_scrape_progress)
+            scrape_result = _run_async(
+                scrape_documentation(url, on_progress=on_scrape_progress)
+            )
     except Exception as e:
         print_error(f"Failed to scrape documentation: {e}")
         raise typer.Exit(1)
@@ -541,14 +545,15 @@ def generate() -> None:
 
     # Show extraction results
     if operations:
-        print_success(f"Found {len(operations)} API operations")
-        for op in operations[:5]:
-            console.print(f"  [dim]• {op.method} {op.path}[/dim]")
-        if len(operations) > 5:
-            console.print(f"  [dim]... and {len(operations) - 5} more[/dim]")
-        
-        # Show extraction cost
-        console.print(f"\n[dim]Extraction: {extraction_stats.format_summary()}[/dim]")
+        with buffered_output():
+            print_success(f"Found {len(operations)} API operations")
+            preview = [f"  • {op.method} {op.path}" for op in operations[:5]]
+            if len(operations) > 5:
+                preview.append(f"  ... and {len(operations) - 5} more")
+            print_muted_lines(preview)
+
+            # Show extraction cost
+            console.print(f"\n[dim]Extraction: {extraction_stats.format_summary()}[/dim]")
     else:
         print_warning("No API operations found in documentation")
 
@@ -860,9 +865,14 @@ def generate() -> None:
     if not targets:
         print_info("No MCP clients detected. Run 'apitomcp install' after installing Cursor or Claude Desktop.")
     else:
-        # Check which targets already have this server installed
-        already_installed = [t for t in targets if is_installed_in_target(server_name, t.config_path)]
-        not_installed = [t for t in targets if not is_installed_in_target(server_name, t.config_path)]
+        # Check which targets already have this server installed (one config read per target)
+        already_installed = []
+        not_installed = []
+        for t in targets:
+            if is_installed_in_target(server_name, t.config_path):
+                already_installed.append(t)
+            else:
+                not_installed.append(t)
         
         # Notify about updates to existing installations
         for target in already_installed:
@@ -888,16 +898,13 @@ def generate() -> None:
                     print_info("Run 'apitomcp install' to add it later.")
             else:
                 # Multiple targets available - let user select
-                print_info("Multiple MCP clients detected:")
-                for target in not_installed:
-                    print_info(f"  • {target.display_name}")
-                
-                choices = [
-                    Choice(value=target.name, name=target.display_name)
-                    for target in not_installed
-                ]
+                choices = []
+                with buffered_output():
+                    print_info("Multiple MCP clients detected:")
+                    for target in not_installed:
+                        print_info(f"  • {target.display_name}")
+                        choices.append(Choice(value=target.name, name=target.display_name))
                 
-                console.print("[muted]Use space to toggle, enter to confirm[/muted]")
                 selected_names = prompt_select_multiple(
                     f"Install '{server_name}' to",
                     choices,
@@ -1041,9 +1048,8 @@ def install() -> None:
     from InquirerPy.base.control import Choice
 
     from apitomcp.config import list_servers as get_servers
-    from apitomcp.installer import detect_available_targets, install_to_target, is_installed_in_target
+    from apitomcp.installer import detect_available_targets, install_to_target, load_mcp_config
     from apitomcp.ui import (
-        console,
         print_error,
         print_header,
         print_info,
@@ -1068,9 +1074,10 @@ def install() -> None:
 
     print_info(f"Found servers: {', '.join(sorted(servers))}")
 
-    # Check which targets already have any of the servers installed
+    # Check which targets already have any of the servers installed (one config read per target)
     def has_any_server_installed(target):
-        return any(is_installed_in_target(s, target.config_path) for s in servers)
+        installed = load_mcp_config(target.config_path).get("mcpServers", {})
+        return any(s in installed for s in servers)
 
     # Multi-select for installation targets, pre-select targets that already have servers
     choices = [
@@ -1082,7 +1089,6 @@ def install() -> None:
         for target in targets
     ]
 
-    console.print("[muted]Use space to toggle, enter to confirm[/muted]")
     selected_names = prompt_select_multiple(
         "Select installation targets",
         choices,
@@ -1123,6 +1129,7 @@ def output() -> None:
     from apitomcp.config import get_servers_dir
     from apitomcp.config import list_servers as get_servers
     from apitomcp.ui import (
+        buffered_output,
         print_error,
         print_header,
         print_info,
@@ -1150,10 +1157,11 @@ def output() -> None:
     # Copy files
     shutil.copytree(server_dir, dest_dir)
 
-    print_success(f"Exported to ./{server_name}/")
-    print_info("Files exported:")
-    for file in dest_dir.iterdir():
-        print_info(f"  - {file.name}")
+    with buffered_output():
+        print_success(f"Exported to ./{server_name}/")
+        print_info("Files exported:")
+        for file in dest_dir.iterdir():
+            print_info(f"  - {file.name}")
 
 
 @app.command()
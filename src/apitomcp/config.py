@@ -57,6 +57,13 @@ def get_servers_dir() -> Path:
     return servers_dir
 
 
+def get_markdown_cache_dir() -> Path:
+    """Get the scraped-page markdown cache directory (~/.apitomcp/cache/markdown)."""
+    cache_dir = get_apitomcp_dir() / "cache" / "markdown"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
 def get_config_path() -> Path:
     """Get the config file path (~/.apitomcp/config.json)."""
     return get_apitomcp_dir() / "config.json"
@@ -458,6 +458,10 @@ If NO valid API operations are found, or all candidates look invalid, return:
 
 Return ONLY the JSON, no other text."""
 
+# Cheap pre-filter: a page can only document an operation if it names an HTTP method
+# (any case, e.g. lowercase method badges) or shows a cURL example
+HTTP_METHOD_HINT_PATTERN = re.compile(r"\b(?:get|post|put|patch|delete)\b|curl", re.IGNORECASE)
+
 
 async def extract_operations_from_page(
     markdown: str,
@@ -493,6 +497,10 @@ async def extract_operations_from_page(
     if not markdown or len(markdown.strip()) < 100:
         return []
 
+    # Skip pages with no HTTP method mentions rather than spending an LLM call on them
+    if not HTTP_METHOD_HINT_PATTERN.search(markdown):
+        return []
+
     # Truncate if too long
     max_length = 12000
     if len(markdown) > max_length:
@@ -1,11 +1,41 @@
 """MCP configuration installer for Cursor and Claude Desktop."""
 
+import functools
 import json
 import os
+import re
 import sys
 from pathlib import Path
 from typing import NamedTuple
 
+try:
+    import orjson
+except ImportError:  # Optional speedup (pip install apitomcp[speedups])
+    orjson = None
+
+# orjson reads integers wider than 64 bits as floats; such files go to the stdlib
+WIDE_INT_PATTERN = re.compile(rb"\d{19,}")
+
+
+def _loads_json(data: bytes) -> dict:
+    """Decode JSON with orjson when available, falling back to the stdlib for anything it rejects."""
+    if orjson is not None and not WIDE_INT_PATTERN.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. a UTF-8 BOM or NaN, both of which json accepts
+    return json.loads(data)
+
+
+def _dumps_json(config: dict) -> bytes:
+    """Encode JSON with orjson when available, falling back to the stdlib for anything it rejects."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers wider than 64 bits
+    return json.dumps(config, indent=2).encode("utf-8")
+
 
 class InstallTarget(NamedTuple):
     """Represents an MCP client installation target."""
@@ -26,14 +56,16 @@ def load_mcp_config(config_path: Path) -> dict:
     Returns:
         The configuration dictionary
     """
-    if not config_path.exists():
+    try:
+        with open(config_path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
         return {"mcpServers": {}}
 
-    with open(config_path, encoding="utf-8") as f:
-        try:
-            config = json.load(f)
-        except json.JSONDecodeError:
-            return {"mcpServers": {}}
+    try:
+        config = _loads_json(data)
+    except json.JSONDecodeError:
+        return {"mcpServers": {}}
 
     if "mcpServers" not in config:
         config["mcpServers"] = {}
@@ -49,10 +81,17 @@ def save_mcp_config(config_path: Path, config: dict) -> None:
         config_path: Path to the config JSON file
         config: The configuration dictionary to save
     """
-    config_path.parent.mkdir(parents=True, exist_ok=True)
+    data = _dumps_json(config)
+
+    try:
+        f = open(config_path, "wb")
+    except FileNotFoundError:
+        # First install for this client: create its config directory
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        f = open(config_path, "wb")
 
-    with open(config_path, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2)
+    with f:
+        f.write(data)
 
 
 def build_server_entry(server_name: str, server_config: dict) -> dict:
@@ -110,9 +149,6 @@ def is_installed_in_target(server_name: str, config_path: Path) -> bool:
     Returns:
         True if the server is installed
     """
-    if not config_path.exists():
-        return False
-
     mcp_config = load_mcp_config(config_path)
     return server_name in mcp_config.get("mcpServers", {})
 
@@ -141,10 +177,13 @@ def uninstall_from_target(server_name: str, config_path: Path) -> bool:
 
 # --- Cursor-specific Functions ---
 
+@functools.lru_cache(maxsize=1)
 def detect_cursor_config() -> Path | None:
     """
     Detect the Cursor MCP configuration file path.
 
+    The result is cached for the life of the process.
+
     Returns:
         Path to the config file, or None if not found
     """
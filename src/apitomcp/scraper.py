@@ -2,21 +2,53 @@
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import codecs
+import contextlib
+import functools
+import hashlib
+import heapq
+import io
+import itertools
+import multiprocessing
+import os
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Callable
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlsplit
 
 import httpx
-from bs4 import BeautifulSoup, Tag
 from markitdown import MarkItDown
+from markitdown import __version__ as markitdown_version
+from selectolax.lexbor import LexborHTMLParser
 
-# Number of parallel fetches
-MAX_WORKERS = 8
+from apitomcp.config import get_markdown_cache_dir
 
+# Number of pages fetched concurrently per crawl wave
+MAX_CONCURRENT_FETCHES = 16
 
-@dataclass
+# Per-page markdown cap (characters); keeps giant generated reference pages bounded
+MAX_PAGE_MARKDOWN_CHARS = 256 * 1024
+
+# Markdown cache: entries are keyed by format version and MarkItDown version, so
+# upgrades never serve stale conversions; least recently used entries are pruned
+# after each crawl once the cache outgrows its size cap
+MARKDOWN_CACHE_VERSION = 1
+MARKDOWN_CACHE_MAX_BYTES = 128 * 1024 * 1024
+_MARKDOWN_CACHE_KEY_PREFIX = f"{MARKDOWN_CACHE_VERSION}\0{markitdown_version}\0".encode()
+
+# Shared HTTP client settings for a crawl
+USER_AGENT = "Mozilla/5.0 (compatible; apitomcp/1.0; +https://github.com/apitomcp)"
+CONNECTION_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+
+@dataclass(slots=True)
 class Operation:
     """Represents a single API operation extracted from documentation."""
 
@@ -56,6 +88,16 @@ class ScrapeProgress:
     current_url: str
 
 
+@dataclass
+class PageResult:
+    """Result from parsing a single page."""
+
+    url: str
+    links: list[tuple[int, str]]
+    markdown: str
+    auth_content: str
+
+
 # Navigation link keywords (prioritize these)
 NAV_KEYWORDS = [
     "api",
@@ -129,14 +171,397 @@ AUTH_URL_KEYWORDS = [
     "getting-started",
 ]
 
-# Heading patterns that indicate auth sections
-AUTH_HEADING_PATTERN = re.compile(
-    r"^#+\s*(authentication|authorization|auth|oauth|getting\s+started|access\s+token|api\s+key|credentials|client\s+credentials)",
+
+def _keyword_pattern(keywords: list[str], overlapping: bool = False) -> re.Pattern[str]:
+    """
+    Compile a keyword list into one substring-matching alternation.
+
+    With overlapping=True the alternation sits in a lookahead, so findall()
+    reports a keyword at every position instead of skipping past earlier matches.
+    """
+    alternation = "|".join(map(re.escape, keywords))
+    return re.compile(f"(?=({alternation}))" if overlapping else alternation)
+
+
+# Precompiled keyword matchers (run against lowercased text)
+NAV_PATTERN = _keyword_pattern(NAV_KEYWORDS, overlapping=True)
+NAV_KEYWORD_PRIORITY = {keyword: i for i, keyword in enumerate(NAV_KEYWORDS)}
+ENDPOINT_PATTERN = _keyword_pattern(ENDPOINT_KEYWORDS)
+SKIP_PATTERN = _keyword_pattern(SKIP_KEYWORDS)
+AUTH_URL_PATTERN = _keyword_pattern(AUTH_URL_KEYWORDS)
+
+# Common patterns for API base URLs, one named group each in order of preference
+BASE_URL_PATTERN = re.compile(
+    r"(?P<api_subdomain>https?://api\.[a-zA-Z0-9.-]+(?:/v\d+)?)"
+    r"|(?P<api_path>https?://[a-zA-Z0-9.-]+/api(?:/v\d+)?)"
+    r"|(?P<version_path>https?://[a-zA-Z0-9.-]+/v\d+)"
+)
+
+# Link suffixes that point at file downloads rather than documentation pages
+DOWNLOAD_EXTENSIONS = (".pdf", ".zip", ".tar", ".gz", ".tgz", ".dmg", ".exe")
+DOWNLOAD_EXTENSION_MAX_LEN = max(map(len, DOWNLOAD_EXTENSIONS))
+
+# Elements removed from every page before link extraction and conversion
+NOISE_TAGS = ["script", "style", "footer", "header", "noscript", "svg", "iframe"]
+
+# CSS selector for links inside navigation elements (sidebar, nav, menu, toc)
+NAV_LINK_SELECTOR = ", ".join(
+    f"{container} a[href]"
+    for container in (
+        "nav",
+        "aside",
+        "[class*=sidebar i]",
+        "[class*=menu i]",
+        "[class*=nav i]",
+        "[class*=toc i]",
+        "[id*=sidebar i]",
+        "[id*=menu i]",
+        "[id*=nav i]",
+        "[id*=toc i]",
+    )
+)
+
+# Markdown heading lines, scanned in a single pass. "hashes" gives the level,
+# "boundary" is set when the line is a well-formed heading that can end a
+# section, and "auth" is set when the heading introduces auth documentation.
+HEADING_PATTERN = re.compile(
+    r"^(?P<hashes>#+)(?P<boundary>(?=\s+\S))?"
+    r"(?P<auth>\s*(?:authentication|authorization|auth|oauth|getting\s+started|access\s+token|api\s+key|credentials|client\s+credentials))?",
     re.IGNORECASE | re.MULTILINE,
 )
 
 
-def scrape_documentation(
+@functools.lru_cache(maxsize=4096)
+def is_valid_doc_link(href: str, base_netloc: str) -> bool:
+    """Check if a link is likely documentation and on the same domain."""
+    if not href:
+        return False
+
+    # Skip anchors, javascript, mailto, etc.
+    if href.startswith(("#", "javascript:", "mailto:", "tel:", "data:")):
+        return False
+
+    # Skip file downloads (only the tail needs case-folding for the suffix check)
+    if href[-DOWNLOAD_EXTENSION_MAX_LEN:].lower().endswith(DOWNLOAD_EXTENSIONS):
+        return False
+
+    # Parse the link
+    netloc = urlsplit(href).netloc
+
+    # If it's a relative link, it's on the same domain
+    if not netloc:
+        return True
+
+    # Check if it's the same domain
+    return netloc == base_netloc
+
+
+def resolve_link(href: str, page_url: str, page_origin: str) -> str:
+    """Resolve an href against its page, dropping the query string and fragment."""
+    # Root-relative links (the common sidebar case) only need the page origin.
+    # Anything urlparse would clean up (tabs/newlines, ;params) takes the slow path.
+    if (
+        href.startswith("/")
+        and not href.startswith("//")
+        and "/." not in href
+        and ";" not in href
+        and href.isprintable()
+    ):
+        return page_origin + href.split("#", 1)[0].split("?", 1)[0]
+
+    if not href.startswith(("http://", "https://")):
+        href = urljoin(page_url, href)
+
+    parsed = urlparse(href)
+    return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+
+
+_converter: MarkItDown | None = None
+
+
+def _get_markdown_converter() -> MarkItDown:
+    """Get this worker process's MarkItDown converter, creating it on first use."""
+    global _converter
+    if _converter is None:
+        _converter = MarkItDown()
+    return _converter
+
+
+def convert_html_to_markdown(html: str, cache_dir: Path) -> str | None:
+    """
+    Convert HTML to markdown with MarkItDown, caching results by content hash.
+
+    Args:
+        html: The (cleaned) page HTML
+        cache_dir: Directory holding cached conversions
+
+    Returns:
+        The markdown, or None if conversion failed
+    """
+    html_bytes = html.encode("utf-8")
+    cache_key = hashlib.blake2b(_MARKDOWN_CACHE_KEY_PREFIX, digest_size=16)
+    cache_key.update(html_bytes)
+    cache_path = cache_dir / f"{cache_key.hexdigest()}.md"
+
+    try:
+        markdown = cache_path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+    else:
+        # Refresh the mtime so pruning treats this entry as recently used
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return markdown
+
+    converter = _get_markdown_converter()
+    try:
+        result = converter.convert_stream(io.BytesIO(html_bytes), file_extension=".html")
+    except Exception:
+        return None
+    markdown = result.text_content
+
+    # Write to a per-process temp file first so concurrent readers never see a partial entry
+    try:
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(markdown, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+    return markdown
+
+
+def prune_markdown_cache(cache_dir: Path, max_bytes: int = MARKDOWN_CACHE_MAX_BYTES) -> None:
+    """
+    Delete the least recently used cache entries until the cache fits in max_bytes.
+
+    Args:
+        cache_dir: Directory holding cached conversions
+        max_bytes: Size cap for all entries together
+    """
+    entries: list[tuple[float, int, str]] = []
+    total_bytes = 0
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".md"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_bytes += stat.st_size
+    except OSError:
+        return
+
+    if total_bytes <= max_bytes:
+        return
+
+    entries.sort()
+    for _, size, path in entries:
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total_bytes -= size
+        if total_bytes <= max_bytes:
+            break
+
+
+def is_auth_related_url(page_url: str) -> bool:
+    """Check if URL is likely about authentication."""
+    return AUTH_URL_PATTERN.search(page_url.lower()) is not None
+
+
+def extract_auth_sections(markdown: str) -> str:
+    """Extract authentication-related sections from markdown."""
+    sections: list[str] = []
+
+    # One pass over the headings: collect section boundaries and auth headings
+    boundary_starts: list[int] = []
+    boundary_levels: list[int] = []
+    auth_headings: list[tuple[int, int, int]] = []  # (start, end, level)
+    for heading in HEADING_PATTERN.finditer(markdown):
+        if heading.group("boundary") is not None:
+            boundary_starts.append(heading.start())
+            boundary_levels.append(len(heading.group("hashes")))
+        if heading.group("auth"):
+            # Level is the heading's first token, so "###API key" counts as 6
+            level = len(heading.group(0).split()[0])
+            auth_headings.append((heading.start(), heading.end(), level))
+
+    for section_start, heading_end, heading_level in auth_headings:
+        # Find next heading of same or higher level, or end of document
+        section_end = len(markdown)
+        for i in range(bisect.bisect_left(boundary_starts, heading_end), len(boundary_starts)):
+            if boundary_levels[i] <= heading_level:
+                section_end = boundary_starts[i]
+                break
+
+        section = markdown[section_start:section_end].strip()
+        if section:
+            sections.append(section)
+
+    return "\n\n---\n\n".join(sections)
+
+
+def get_link_priority(href: str, link_text: str, base_path: str) -> int:
+    """Determine priority of a link (lower = higher priority)."""
+    # Search href and text together; the NUL separator stops matches spanning both
+    blob = f"{href.lower()}\x00{link_text.lower()}"
+
+    # Skip links with bad keywords
+    if SKIP_PATTERN.search(blob):
+        return 999  # Very low priority (skip)
+
+    # Highest priority: actual endpoint documentation pages
+    if ENDPOINT_PATTERN.search(blob):
+        return 1  # Very high priority for endpoint pages
+
+    # High priority: sibling pages (same path prefix as starting URL)
+    if base_path and href.startswith(base_path):
+        return 5
+
+    # Medium-high priority for navigation keywords
+    nav_matches = NAV_PATTERN.findall(blob)
+    if nav_matches:
+        # Priority based on the earliest-listed keyword present
+        return 10 + min(NAV_KEYWORD_PRIORITY[keyword] for keyword in nav_matches)
+
+    return 50  # Default medium priority
+
+
+def extract_navigation_links(
+    tree: LexborHTMLParser,
+    page_url: str,
+    base_netloc: str,
+    base_path: str,
+) -> list[tuple[int, str]]:
+    """Extract links from navigation elements with priority, each URL at most once."""
+    # Split the page URL once; most links are resolved against its origin
+    page_parts = urlsplit(page_url)
+    page_origin = f"{page_parts.scheme}://{page_parts.netloc}"
+
+    # Collect links from navigation elements (sidebar, nav, menu) with higher priority.
+    # A URL linked several times keeps its best priority, in first-seen order.
+    nav_links: dict[str, int] = {}
+    for link in tree.css(NAV_LINK_SELECTOR):
+        href = link.attributes.get("href") or ""
+        try:
+            clean_url = resolve_link(href, page_url, page_origin)
+            if not is_valid_doc_link(href, base_netloc):
+                continue
+        except ValueError:
+            continue  # Malformed href (e.g. an unclosed IPv6 bracket)
+
+        link_text = link.text(strip=True)
+        priority = get_link_priority(href, link_text, base_path)
+        if priority < nav_links.get(clean_url, 999):
+            nav_links[clean_url] = priority
+
+    # Also get links from main content but with lower priority
+    content_links: dict[str, int] = {}
+    for link in tree.css("a[href]"):
+        href = link.attributes.get("href") or ""
+        try:
+            clean_url = resolve_link(href, page_url, page_origin)
+            if clean_url in nav_links or not is_valid_doc_link(href, base_netloc):
+                continue
+        except ValueError:
+            continue
+
+        link_text = link.text(strip=True)
+        priority = get_link_priority(href, link_text, base_path) + 20  # Lower priority than nav
+        if priority < content_links.get(clean_url, 999):
+            content_links[clean_url] = priority
+
+    return [(priority, clean_url) for clean_url, priority in nav_links.items()] + [
+        (priority, clean_url) for clean_url, priority in content_links.items()
+    ]
+
+
+def parse_page(
+    page_url: str,
+    html: str | bytes,
+    base_netloc: str,
+    base_path: str,
+    cache_dir: Path,
+) -> PageResult:
+    """
+    Parse a fetched page into links, markdown, and auth content.
+
+    Runs in a worker process, so everything it needs is passed in.
+
+    Args:
+        page_url: The URL the page was fetched from
+        html: The page HTML, as raw bytes unless the server declared a non-UTF-8 charset
+        base_netloc: Network location of the crawl's starting URL
+        base_path: Directory path of the crawl's starting URL
+        cache_dir: Directory holding cached markdown conversions
+
+    Returns:
+        PageResult for the page
+    """
+    # Parse HTML
+    # For raw bytes, lexbor sniffs the encoding from a BOM or <meta charset>
+    tree = LexborHTMLParser(html, encoding=True)
+
+    # Remove script, style, and irrelevant elements in one traversal
+    tree.strip_tags(NOISE_TAGS)
+
+    # Extract navigation links
+    links = extract_navigation_links(tree, page_url, base_netloc, base_path)
+
+    # Convert the cleaned DOM rather than the raw page, so MarkItDown's own
+    # parse skips the scripts and styles already stripped above
+    cleaned_html = tree.html or ""
+
+    # Convert to markdown, falling back to plain text if conversion fails
+    markdown = convert_html_to_markdown(cleaned_html, cache_dir)
+    if markdown is None:
+        markdown = tree.root.text(separator="\n", strip=True).strip() if tree.root else ""
+
+    if len(markdown) > MAX_PAGE_MARKDOWN_CHARS:
+        markdown = markdown[:MAX_PAGE_MARKDOWN_CHARS] + "\n[truncated]"
+
+    # Extract auth content
+    auth_content = ""
+    if markdown:
+        if is_auth_related_url(page_url):
+            auth_content = f"# Auth Source: {page_url}\n\n{markdown}"
+        else:
+            auth_sections = extract_auth_sections(markdown)
+            if auth_sections:
+                auth_content = f"# Auth Section from: {page_url}\n\n{auth_sections}"
+
+    return PageResult(
+        url=page_url,
+        links=links,
+        markdown=markdown or "",
+        auth_content=auth_content,
+    )
+
+
+def _create_parse_pool() -> ProcessPoolExecutor | None:
+    """Create the process pool that parses fetched pages, or None to parse in-process."""
+    # Workers re-import the caller's __main__ from its file; when that file doesn't
+    # exist (code piped to `python -`, embedded interpreters) they can't start
+    main_file = getattr(sys.modules.get("__main__"), "__file__", None)
+    if main_file is not None and not os.path.exists(main_file):
+        return None
+
+    # forkserver workers start clean instead of copying the crawler's event loop and sockets
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else None
+    return ProcessPoolExecutor(
+        max_workers=min(MAX_CONCURRENT_FETCHES, os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context(start_method),
+    )
+
+
+async def scrape_documentation(
     url: str,
     max_pages: int = 200,
     on_progress: Callable[[ScrapeProgress], None] | None = None,
@@ -152,253 +577,142 @@ def scrape_documentation(
     Returns:
         ScrapingResult with page markdowns for LLM extraction
     """
+    url = sys.intern(url)
     visited: set[str] = set()
+    best_priority: dict[str, int] = {url: 0}  # Best priority each URL has been queued with
     page_markdowns: list[PageMarkdown] = []
-    markdown_parts: list[str] = []  # For combined raw markdown
+    raw_markdown = io.StringIO()  # Combined markdown of all pages, built incrementally
     auth_content_parts: list[str] = []  # Collect auth documentation
 
     # Parse the starting URL to get the domain
     parsed_start = urlparse(url)
     domain = f"{parsed_start.scheme}://{parsed_start.netloc}"
+    domain_netloc = parsed_start.netloc
     base_path = parsed_start.path.rsplit("/", 1)[0] if "/" in parsed_start.path else ""
 
-    # Initialize MarkItDown converter
-    md_converter = MarkItDown()
-
-    # Priority queue: (priority, url) - lower priority = process first
-    pages_to_visit: list[tuple[int, str]] = [(0, url)]
-
-    def is_auth_related_url(page_url: str) -> bool:
-        """Check if URL is likely about authentication."""
-        lower_url = page_url.lower()
-        return any(kw in lower_url for kw in AUTH_URL_KEYWORDS)
-
-    def extract_auth_sections(markdown: str) -> str:
-        """Extract authentication-related sections from markdown."""
-        sections: list[str] = []
-
-        # Find all auth-related headings and extract their sections
-        matches = list(AUTH_HEADING_PATTERN.finditer(markdown))
-
-        for i, match in enumerate(matches):
-            section_start = match.start()
-            # Find next heading of same or higher level, or end of document
-            heading_level = len(match.group(0).split()[0])  # Count #s
-            next_heading_pattern = re.compile(
-                rf"^#{{1,{heading_level}}}\s+\S",
-                re.MULTILINE,
-            )
-            next_match = next_heading_pattern.search(markdown, match.end())
-            section_end = next_match.start() if next_match else len(markdown)
-
-            section = markdown[section_start:section_end].strip()
-            if section:
-                sections.append(section)
-
-        return "\n\n---\n\n".join(sections)
-
-    def get_link_priority(href: str, link_text: str) -> int:
-        """Determine priority of a link (lower = higher priority)."""
-        lower_href = href.lower()
-        lower_text = link_text.lower()
-
-        # Skip links with bad keywords
-        for keyword in SKIP_KEYWORDS:
-            if keyword in lower_href or keyword in lower_text:
-                return 999  # Very low priority (skip)
-
-        # Highest priority: actual endpoint documentation pages
-        for keyword in ENDPOINT_KEYWORDS:
-            if keyword in lower_href or keyword in lower_text:
-                return 1  # Very high priority for endpoint pages
-
-        # High priority: sibling pages (same path prefix as starting URL)
-        if base_path and href.startswith(base_path):
-            return 5
-
-        # Medium-high priority for navigation keywords
-        for i, keyword in enumerate(NAV_KEYWORDS):
-            if keyword in lower_href or keyword in lower_text:
-                return 10 + i  # Priority based on keyword position
-
-        return 50  # Default medium priority
-
-    def is_valid_doc_link(href: str, base_domain: str) -> bool:
-        """Check if a link is likely documentation and on the same domain."""
-        if not href:
-            return False
-
-        # Skip anchors, javascript, mailto, etc.
-        if href.startswith(("#", "javascript:", "mailto:", "tel:", "data:")):
-            return False
-
-        # Skip file downloads
-        if any(href.lower().endswith(ext) for ext in [".pdf", ".zip", ".tar", ".gz"]):
-            return False
-
-        # Parse the link
-        parsed = urlparse(href)
-
-        # If it's a relative link, it's on the same domain
-        if not parsed.netloc:
-            return True
-
-        # Check if it's the same domain
-        return parsed.netloc == urlparse(base_domain).netloc
-
-    def extract_navigation_links(soup: BeautifulSoup, page_url: str) -> list[tuple[int, str]]:
-        """Extract links from navigation elements with priority."""
-        links: list[tuple[int, str]] = []
-
-        # Look for navigation elements first (sidebar, nav, menu)
-        nav_elements = soup.find_all(["nav", "aside"])
-        nav_elements.extend(soup.find_all(class_=re.compile(r"(sidebar|menu|nav|toc)", re.I)))
-        nav_elements.extend(soup.find_all(id=re.compile(r"(sidebar|menu|nav|toc)", re.I)))
-
-        # Collect links from nav elements with higher priority
-        nav_links = set()
-        for nav in nav_elements:
-            for link in nav.find_all("a", href=True):
-                href = link["href"]
-                absolute_url = urljoin(page_url, href)
-                parsed = urlparse(absolute_url)
-                clean_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-
-                if is_valid_doc_link(href, domain) and clean_url not in visited:
-                    link_text = link.get_text(strip=True)
-                    priority = get_link_priority(href, link_text)
-                    if priority < 999:
-                        nav_links.add(clean_url)
-                        links.append((priority, clean_url))
-
-        # Also get links from main content but with lower priority
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-            absolute_url = urljoin(page_url, href)
-            parsed = urlparse(absolute_url)
-            clean_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-
-            if clean_url not in nav_links and clean_url not in visited:
-                if is_valid_doc_link(href, domain):
-                    link_text = link.get_text(strip=True)
-                    priority = get_link_priority(href, link_text) + 20  # Lower priority than nav
-                    if priority < 999:
-                        links.append((priority, clean_url))
-
-        return links
-
-    @dataclass
-    class PageResult:
-        """Result from scraping a single page."""
-        url: str
-        links: list[tuple[int, str]]
-        markdown: str
-        auth_content: str
-
-    def fetch_page(page_url: str) -> PageResult | None:
-        """Fetch and parse a single page. Thread-safe (no shared state mutation)."""
+    # Converted markdown is cached on disk by page content
+    markdown_cache_dir = get_markdown_cache_dir()
+
+    # Priority heap: (priority, insertion order, url) - lower priority = process first.
+    # The insertion counter keeps equal priorities in discovery order.
+    push_order = itertools.count()
+    pages_to_visit: list[tuple[int, int, str]] = [(0, next(push_order), url)]
+
+    async def fetch_page(
+        client: httpx.AsyncClient,
+        page_url: str,
+    ) -> PageResult | None:
+        """Fetch a single page and parse it in the worker pool."""
         try:
-            response = httpx.get(
-                page_url,
-                follow_redirects=True,
-                timeout=30.0,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (compatible; apitomcp/1.0; +https://github.com/apitomcp)"
-                },
-            )
+            response = await client.get(page_url)
             response.raise_for_status()
-        except httpx.HTTPError:
+        except (httpx.HTTPError, httpx.InvalidURL):
             return None
 
-        # Parse HTML
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        # Remove script, style, and irrelevant elements
-        for element in soup(["script", "style", "footer", "header"]):
-            element.decompose()
-
-        # Extract navigation links
-        links = extract_navigation_links(soup, page_url)
-
-        # Convert to markdown (each thread needs its own converter)
-        local_converter = MarkItDown()
+        # Ship raw bytes to the parser; decoding via response.text (which may run
+        # charset detection) is only needed when the server declares another known
+        # charset. Unknown labels are left to the parser's own sniffing.
+        html: str | bytes = response.content
+        charset = response.charset_encoding
+        if charset is not None:
+            try:
+                if codecs.lookup(charset).name != "utf-8":
+                    html = response.text
+            except LookupError:
+                pass
+
+        nonlocal parse_pool
+        parse_args = (page_url, html, domain_netloc, base_path, markdown_cache_dir)
         try:
-            result = local_converter.convert_stream(
-                response.text.encode("utf-8"),
-                file_extension=".html",
-            )
-            markdown = result.text_content
+            # Parse in a worker process so CPU-bound parsing uses every core
+            if parse_pool is not None:
+                try:
+                    return await loop.run_in_executor(parse_pool, parse_page, *parse_args)
+                except BrokenProcessPool:
+                    # Workers died or could not start (e.g. an embedded caller whose
+                    # __main__ is not importable); parse the rest of the crawl in-process
+                    parse_pool = None
+            return await asyncio.to_thread(parse_page, *parse_args)
         except Exception:
-            markdown = soup.get_text(separator="\n", strip=True)
-
-        # Extract auth content
-        auth_content = ""
-        if markdown:
-            if is_auth_related_url(page_url):
-                auth_content = f"# Auth Source: {page_url}\n\n{markdown}"
-            else:
-                auth_sections = extract_auth_sections(markdown)
-                if auth_sections:
-                    auth_content = f"# Auth Section from: {page_url}\n\n{auth_sections}"
-
-        return PageResult(
-            url=page_url,
-            links=links,
-            markdown=markdown or "",
-            auth_content=auth_content,
-        )
-
-    # Parallel scraping with thread pool
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        while pages_to_visit and len(visited) < max_pages:
-            # Sort by priority and get batch of highest priority URLs
-            pages_to_visit.sort(key=lambda x: x[0])
-            
-            # Get batch of URLs to fetch (up to MAX_WORKERS, respecting max_pages)
-            batch_urls: list[str] = []
-            while pages_to_visit and len(batch_urls) < MAX_WORKERS and len(visited) + len(batch_urls) < max_pages:
-                _, url = pages_to_visit.pop(0)
-                if url not in visited:
-                    batch_urls.append(url)
-                    visited.add(url)  # Mark as visited before fetching to avoid duplicates
-
-            if not batch_urls:
-                break
-
-            # Fetch pages in parallel
-            futures = {executor.submit(fetch_page, url): url for url in batch_urls}
-            
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
-                    # Collect results
-                    if result.markdown:
-                        page_markdowns.append(PageMarkdown(
-                            url=result.url,
-                            markdown=result.markdown,
-                        ))
-                        markdown_parts.append(f"# Source: {result.url}\n\n{result.markdown}\n\n---\n")
-                    if result.auth_content:
-                        auth_content_parts.append(result.auth_content)
-                    
-                    # Add new links to queue
-                    for priority, link in result.links:
-                        if link not in visited:
-                            pages_to_visit.append((priority, link))
-                    
-                    # Update progress after each page completes
-                    if on_progress:
-                        on_progress(ScrapeProgress(
-                            pages_scraped=len(visited),
-                            pages_queued=len(pages_to_visit),
-                            current_url=result.url,
-                        ))
+            return None  # One unparseable page shouldn't end the crawl
+
+    # Crawl in waves over a single keep-alive client, parsing in worker processes
+    loop = asyncio.get_running_loop()
+    parse_pool: ProcessPoolExecutor | None
+    with _create_parse_pool() or contextlib.nullcontext() as parse_pool:
+        async with httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            timeout=30.0,
+            headers={"User-Agent": USER_AGENT},
+            limits=CONNECTION_LIMITS,
+        ) as client:
+            while pages_to_visit and len(visited) < max_pages:
+                # Get batch of URLs to fetch (up to MAX_CONCURRENT_FETCHES, respecting max_pages)
+                batch_urls: list[str] = []
+                while (
+                    pages_to_visit
+                    and len(batch_urls) < MAX_CONCURRENT_FETCHES
+                    and len(visited) + len(batch_urls) < max_pages
+                ):
+                    priority, _, url = heapq.heappop(pages_to_visit)
+                    # Entries superseded by a later, better-priority push are stale
+                    if url not in visited and priority == best_priority[url]:
+                        batch_urls.append(url)
+                        visited.add(url)  # Mark as visited before fetching to avoid duplicates
+
+                if not batch_urls:
+                    break
+
+                # Fetch pages concurrently. Workers return each page's links (deduplicated
+                # per page) and the queue below drops the ones already queued at least as
+                # well; sending workers a snapshot of queued URLs instead would pickle a set
+                # that grows with the crawl into every task
+                fetches = [fetch_page(client, url) for url in batch_urls]
+                for coro in asyncio.as_completed(fetches):
+                    result = await coro
+                    if result:
+                        # Collect results
+                        if result.markdown:
+                            page_markdowns.append(PageMarkdown(
+                                url=result.url,
+                                markdown=result.markdown,
+                            ))
+                            if raw_markdown.tell():
+                                raw_markdown.write("\n")
+                            raw_markdown.write(f"# Source: {result.url}\n\n{result.markdown}\n\n---\n")
+                        if result.auth_content:
+                            auth_content_parts.append(result.auth_content)
+
+                        # Add new links to queue, re-queueing a known URL only when this page
+                        # links it with a better priority (e.g. first seen in content, later
+                        # in a sidebar). URLs arrive unpickled from the workers, so intern
+                        # them: each shared-sidebar URL is then stored once, and the
+                        # best_priority/visited lookups compare by identity
+                        for priority, link in result.links:
+                            link = sys.intern(link)
+                            if link in visited:
+                                continue
+                            if link not in best_priority or priority < best_priority[link]:
+                                best_priority[link] = priority
+                                heapq.heappush(pages_to_visit, (priority, next(push_order), link))
+
+                        # Update progress after each page completes
+                        if on_progress:
+                            on_progress(ScrapeProgress(
+                                pages_scraped=len(visited),
+                                pages_queued=len(pages_to_visit),
+                                current_url=result.url,
+                            ))
+
+    # Keep the on-disk markdown cache bounded
+    prune_markdown_cache(markdown_cache_dir)
+
+    # Combined markdown for fallback
+    combined_markdown = raw_markdown.getvalue()
 
     # Detect base URL
-    base_url = detect_api_base_url(markdown_parts, domain)
-
-    # Combine markdown for fallback
-    combined_markdown = "\n".join(markdown_parts)
+    base_url = detect_api_base_url([combined_markdown], domain)
 
     # Combine auth content
     combined_auth_content = "\n\n---\n\n".join(auth_content_parts)
@@ -414,25 +728,16 @@ def scrape_documentation(
 
 def detect_api_base_url(markdown_parts: list[str], domain: str) -> str:
     """Try to detect the API base URL from documentation content."""
-    combined = "\n".join(markdown_parts)
-
-    # Common patterns for API base URLs
-    patterns = [
-        r"https?://api\.[a-zA-Z0-9.-]+(?:/v\d+)?",
-        r"https?://[a-zA-Z0-9.-]+/api(?:/v\d+)?",
-        r"https?://[a-zA-Z0-9.-]+/v\d+",
-    ]
-
-    for pattern in patterns:
-        matches = re.findall(pattern, combined)
-        if matches:
-            # Return the most common match
-            from collections import Counter
-
-            counter = Counter(matches)
-            most_common = counter.most_common(1)
-            if most_common:
-                return most_common[0][0]
+    # Scan each part separately (no combined copy), counting matches per pattern
+    counters: dict[str, Counter[str]] = {name: Counter() for name in BASE_URL_PATTERN.groupindex}
+    for part in markdown_parts:
+        for match in BASE_URL_PATTERN.finditer(part):
+            counters[match.lastgroup][match.group()] += 1
+
+    # Return the most common match of the most preferred pattern
+    for counter in counters.values():
+        if counter:
+            return counter.most_common(1)[0][0]
 
     # Fallback: construct from domain
     parsed = urlparse(domain)
@@ -1,24 +1,32 @@
 """Interactive CLI utilities using InquirerPy for modern UX."""
 
+from __future__ import annotations
+
+import functools
+import os
+import sys
 from contextlib import contextmanager
-from typing import Callable, Generator
-
-from InquirerPy import inquirer
-from InquirerPy.base.control import Choice
-from InquirerPy.utils import get_style
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.status import Status
-from rich.table import Table
+from typing import TYPE_CHECKING, Any, Callable, Generator
+
+from rich.console import Console, Group, RenderableType
+from rich.rule import Rule
+from rich.style import Style
+from rich.text import Text
 from rich.theme import Theme
 
+if TYPE_CHECKING:
+    from InquirerPy.base.control import Choice
+    from rich.progress import Progress
+    from rich.status import Status
+    from rich.table import Table
+
 # Prompt styling - like create-next-app
 QMARK = "?"  # Question mark for unanswered questions
 AMARK = "✔"  # Checkmark for answered questions
 
-# InquirerPy style customization
-PROMPT_STYLE = get_style({
+# InquirerPy style customization (InquirerPy pulls in prompt_toolkit, so it
+# is only imported once a prompt is actually shown)
+PROMPT_COLORS = {
     "questionmark": "#5f87ff",  # Blue question mark
     "answermark": "#5fd75f",    # Green checkmark
     "answer": "#5fd75f",        # Green answer text
@@ -36,7 +44,7 @@ PROMPT_STYLE = get_style({
     "fuzzy_info": "#7f7f7f",
     "fuzzy_border": "#5f87ff",
     "fuzzy_match": "#5fd75f",
-}, style_override=False)
+}
 
 # Custom theme for Rich console output (tables, panels, etc.)
 theme = Theme(
@@ -50,40 +58,94 @@ theme = Theme(
     }
 )
 
-# Force terminal mode for immediate output (no buffering)
-console = Console(theme=theme, force_terminal=True)
+# Pre-parsed styles so Rich doesn't re-parse style strings on every call
+_HEADER_STYLE = Style(bold=True, color="cyan")
+_HEADER_BORDER_STYLE = Style(color="cyan")
+_SUCCESS_STYLE = theme.styles["success"]
+_ERROR_STYLE = theme.styles["error"]
+_WARNING_STYLE = theme.styles["warning"]
+_INFO_STYLE = theme.styles["info"]
+_MUTED_STYLE = theme.styles["muted"]
+
+# Rule is re-measured on render, so one instance serves every divider
+_DIVIDER = Rule(style=_MUTED_STYLE)
+
+# Let Rich detect the terminal (it honours FORCE_COLOR / NO_COLOR) so piped
+# output carries no ANSI codes; automatic repr highlighting is turned off
+console = Console(theme=theme, highlight=False)
+
+
+def _env_flag(name: str) -> bool:
+    """Check whether an environment variable is set to a truthy value."""
+    return os.environ.get(name, "").strip().lower() not in ("", "0", "false", "no", "off")
+
+
+@functools.cache
+def _can_use_interactive() -> bool:
+    """
+    Check once whether stdout is an interactive terminal.
+
+    Transient spinners are skipped when it isn't: they would only stream
+    redraw escape codes into the pipe and leave nothing behind. CI runs,
+    dumb terminals and APITOMCP_NO_INTERACTIVE opt out without a TTY check.
+    """
+    if (
+        _env_flag("CI")
+        or os.environ.get("TERM") == "dumb"
+        or _env_flag("APITOMCP_NO_INTERACTIVE")
+    ):
+        return False
+    return sys.stdout.isatty()
+
+
+def _print_spaced(renderable: RenderableType) -> None:
+    """Print a renderable between blank lines in a single console call."""
+    console.print(Group(Text(), renderable, Text()))
 
 
 def print_header(text: str) -> None:
     """Print a styled header."""
-    console.print()
-    console.print(Panel(text, style="bold cyan", border_style="cyan"))
-    console.print()
+    from rich.panel import Panel
+
+    _print_spaced(Panel(text, style=_HEADER_STYLE, border_style=_HEADER_BORDER_STYLE))
 
 
 def print_success(text: str) -> None:
     """Print a success message."""
-    console.print(f"[success]{text}[/success]")
+    console.print(text, style=_SUCCESS_STYLE)
 
 
 def print_error(text: str) -> None:
     """Print an error message."""
-    console.print(f"[error]{text}[/error]")
+    console.print(text, style=_ERROR_STYLE)
 
 
 def print_warning(text: str) -> None:
     """Print a warning message."""
-    console.print(f"[warning]{text}[/warning]")
+    console.print(text, style=_WARNING_STYLE)
 
 
 def print_info(text: str) -> None:
     """Print an info message."""
-    console.print(f"[info]{text}[/info]")
+    console.print(text, style=_INFO_STYLE)
 
 
 def print_muted(text: str) -> None:
     """Print muted/secondary text."""
-    console.print(f"[muted]{text}[/muted]")
+    console.print(text, style=_MUTED_STYLE)
+
+
+def print_muted_lines(lines: list[str]) -> None:
+    """Print several muted lines in one console call, without markup parsing."""
+    console.print(Group(*(Text(line, style=_MUTED_STYLE) for line in lines)))
+
+
+@functools.cache
+def _get_prompt_style() -> Any:
+    """Build the InquirerPy style on first use."""
+    from InquirerPy.utils import get_style
+
+    return get_style(PROMPT_COLORS, style_override=False)
 
 
 def prompt_text(
@@ -104,6 +166,8 @@ def prompt_text(
     Returns:
         The user's input string
     """
+    from InquirerPy import inquirer
+
     if password:
         result = inquirer.secret(
             message=message,
@@ -111,7 +175,7 @@ def prompt_text(
             validate=validate,
             qmark=QMARK,
             amark=AMARK,
-            style=PROMPT_STYLE,
+            style=_get_prompt_style(),
         ).execute()
     else:
         result = inquirer.text(
@@ -120,7 +184,7 @@ def prompt_text(
             validate=validate,
             qmark=QMARK,
             amark=AMARK,
-            style=PROMPT_STYLE,
+            style=_get_prompt_style(),
         ).execute()
     return result or ""
 
@@ -136,12 +200,14 @@ def prompt_confirm(message: str, default: bool = True) -> bool:
     Returns:
         True if user confirms, False otherwise
     """
+    from InquirerPy import inquirer
+
     return inquirer.confirm(
         message=message,
         default=default,
         qmark=QMARK,
         amark=AMARK,
-        style=PROMPT_STYLE,
+        style=_get_prompt_style(),
     ).execute()
 
 
@@ -161,13 +227,15 @@ def prompt_choice(
     Returns:
         The selected choice string
     """
+    from InquirerPy import inquirer
+
     return inquirer.select(
         message=message,
         choices=choices,
         default=default,
         qmark=QMARK,
         amark=AMARK,
-        style=PROMPT_STYLE,
+        style=_get_prompt_style(),
         pointer="❯",
     ).execute()
 
@@ -176,6 +244,7 @@ def prompt_select_multiple(
     message: str,
     choices: list[str] | list[Choice],
     default: list[str] | None = None,
+    instruction: str = "Use space to toggle, enter to confirm",
 ) -> list[str]:
     """
     Prompt for multiple selection with checkboxes.
@@ -184,17 +253,21 @@ def prompt_select_multiple(
         message: The prompt message
         choices: List of choices
         default: List of pre-selected values
+        instruction: Key hint rendered inline with the question
     
     Returns:
         List of selected choice strings
     """
+    from InquirerPy import inquirer
+
     return inquirer.checkbox(
         message=message,
         choices=choices,
         default=default,
+        instruction=instruction,
         qmark=QMARK,
         amark=AMARK,
-        style=PROMPT_STYLE,
+        style=_get_prompt_style(),
         pointer="❯",
     ).execute()
 
@@ -215,28 +288,49 @@ def prompt_fuzzy(
     Returns:
         The selected choice string
     """
+    from InquirerPy import inquirer
+
     return inquirer.fuzzy(
         message=message,
         choices=choices,
         default=default,
         qmark=QMARK,
         amark=AMARK,
-        style=PROMPT_STYLE,
+        style=_get_prompt_style(),
         pointer="❯",
     ).execute()
 
 
+# Live display shared by nested spinner() calls; torn down with the last task
+_progress: Progress | None = None
+
+
 @contextmanager
 def spinner(message: str) -> Generator[None, None, None]:
     """Show a spinner during a long operation."""
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-        transient=True,
-    ) as progress:
-        progress.add_task(description=message, total=None)
+    global _progress
+
+    if _progress is None:
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        _progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            transient=True,
+            disable=not _can_use_interactive(),
+        )
+        _progress.start()
+
+    progress = _progress
+    task_id = progress.add_task(description=message, total=None)
+    try:
         yield
+    finally:
+        progress.remove_task(task_id)
+        if not progress.tasks:
+            progress.stop()
+            _progress = None
 
 
 class LiveStatus:
@@ -246,8 +340,9 @@ class LiveStatus:
         self._status: Status | None = None
 
     def __enter__(self) -> "LiveStatus":
-        self._status = console.status("", spinner="dots")
-        self._status.__enter__()
+        if _can_use_interactive():
+            self._status = console.status("", spinner="dots")
+            self._status.__enter__()
         return self
 
     def __exit__(self, *args) -> None:
@@ -262,6 +357,8 @@ class LiveStatus:
 
 def create_table(title: str, columns: list[str]) -> Table:
     """Create a styled table."""
+    from rich.table import Table
+
     table = Table(title=title, show_header=True, header_style="bold cyan")
     for col in columns:
         table.add_column(col)
@@ -270,9 +367,7 @@ def create_table(title: str, columns: list[str]) -> Table:
 
 def print_table(table: Table) -> None:
     """Print a table to the console."""
-    console.print()
-    console.print(table)
-    console.print()
+    _print_spaced(table)
 
 
 def print_key_value(key: str, value: str) -> None:
@@ -280,8 +375,13 @@ def print_key_value(key: str, value: str) -> None:
     console.print(f"  [bold]{key}:[/bold] {value}")
 
 
+@contextmanager
+def buffered_output() -> Generator[None, None, None]:
+    """Batch console output so a run of print_* calls is written in one go."""
+    with console:
+        yield
+
+
 def print_divider() -> None:
     """Print a horizontal divider."""
-    console.print()
-    console.rule(style="muted")
-    console.print()
+    _print_spaced(_DIVIDER)